@@ -1,8 +1,12 @@
 """
 Run all QGL demos to verify implementation
 """
+import hashlib
+import mmap
 import os
+import pickle
 import sys
+import tempfile
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from qgl.lexer import QGLLexer
@@ -10,24 +14,69 @@ from qgl.parser import QGLParser
 from engine.admissibility import AdmissibilityEngine
 from engine.inversion import InversionEngine
 
-def run_demo(demo_name, demo_path):
-    """Run a single demo"""
-    print(f"\n{'='*60}")
-    print(f"DEMO: {demo_name}")
-    print(f"{'='*60}")
+# Parsed programs are cached here; bump the magic when the grammar changes
+_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.qgl_cache')
+_CACHE_MAGIC = b'QGL2'
+
+# Banner rule, built once
+_BAR = "=" * 60
+
+def load_program(demo_path, qgl_code):
+    """
+    Parse QGL source, reusing a cached program when the source is unchanged
+    qgl_code: str or UTF-8 bytes-like (e.g. a memory-mapped file)
+    """
+    source = qgl_code.encode() if isinstance(qgl_code, str) else qgl_code
+    key = hashlib.blake2b(source, digest_size=16).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f"{key}.pkl")
+    
+    # 1. Cache hit: same source, cached after the file was last written
+    #    (unreadable entries, e.g. from an older grammar, count as misses)
+    if (os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(demo_path)):
+        try:
+            with open(cache_path, 'rb') as f:
+                if f.read(len(_CACHE_MAGIC)) == _CACHE_MAGIC:
+                    return pickle.load(f)
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass
     
+    # 2. Cache miss: lex, parse and store
+    tokens = QGLLexer().tokenize(qgl_code)
+    program = QGLParser().parse(tokens)
+    
+    # Write to a temp file and move it into place, so an interrupted run
+    # never leaves a truncated entry behind
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
     try:
-        with open(demo_path, 'r') as f:
-            qgl_code = f.read()
-        
-        # Initialize components
-        lexer = QGLLexer()
-        parser = QGLParser()
-        engine = AdmissibilityEngine()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_CACHE_MAGIC)
+            pickle.dump(program, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    
+    return program
+
+def run_demo(demo_name, demo_path, engine, inversion_engine):
+    """Run a single demo with shared (reset) engines"""
+    print(f"\n{_BAR}\nDEMO: {demo_name}\n{_BAR}")
+    
+    try:
+        # Start from clean engines
+        engine.reset()
+        inversion_engine.reset()
         
-        # Parse
-        tokens = lexer.tokenize(qgl_code)
-        program = parser.parse(tokens)
+        # Parse (cached per source); the file is mapped, not copied, so a
+        # cache hit never decodes it
+        with open(demo_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                program = load_program(demo_path, b'')  # empty files can't be mapped
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as qgl_code:
+                    program = load_program(demo_path, qgl_code)
         
         # Check admissibility
         admissible, reason = engine.check_structure(program)
@@ -37,7 +86,6 @@ def run_demo(demo_name, demo_path):
         
         # Try inversion if admissible
         if admissible:
-            inversion_engine = InversionEngine(engine)
             # Try inverting first boundary
             if program.boundaries:
                 first_boundary = program.boundaries[0].name
@@ -63,23 +111,24 @@ def main():
         ("Russell Rejection", "russell_reject.qgl"),
     ]
     
-    print("QGL ADMISSIBILITY ENGINE - DEMO SUITE")
-    print("="*60)
+    print(f"QGL ADMISSIBILITY ENGINE - DEMO SUITE\n{_BAR}")
+    
+    # Engines are built once and reset per demo
+    engine = AdmissibilityEngine()
+    inversion_engine = InversionEngine(engine)
     
     results = []
     for demo_name, demo_file in demos:
         demo_path = os.path.join(demo_dir, demo_file)
         if os.path.exists(demo_path):
-            success = run_demo(demo_name, demo_path)
+            success = run_demo(demo_name, demo_path, engine, inversion_engine)
             results.append((demo_name, success))
         else:
             print(f"\nERROR: Demo file not found: {demo_path}")
             results.append((demo_name, False))
     
     # Summary
-    print(f"\n{'='*60}")
-    print("DEMO SUMMARY")
-    print(f"{'='*60}")
+    print(f"\n{_BAR}\nDEMO SUMMARY\n{_BAR}")
     
     for demo_name, success in results:
         status = "✅ PASS" if success else "❌ FAIL"
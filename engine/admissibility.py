@@ -15,6 +15,12 @@ class AdmissibilityEngine:
         self.constraints: List[callable] = []
         self.accumulation: List[Dict] = []  # Bookkeeping ONLY
         
+        # Containment indices for the program being checked
+        self._contains: Dict[str, Set[str]] = {}      # boundary -> contents
+        self._contained_by: Dict[str, Set[str]] = {}  # name -> boundaries
+        self._indexed_program = None
+        self._indexed_revision = None  # program revision the indices reflect
+        
         # Define global constraints
         self._setup_constraints()
     
@@ -26,26 +32,17 @@ class AdmissibilityEngine:
             return structure_name not in contents
         
         # Constraint 2: No circular containment
-        def no_circular_containment(structures):
-            # Check for A contains B, B contains A
-            for a_name, a_contents in structures.items():
-                for b_name in a_contents:
-                    if b_name in structures and a_name in structures[b_name]:
-                        return False
-            return True
+        def no_circular_containment(contains):
+            # Check for A contains B, B contains A - one lookup per edge
+            return not any(
+                a_name in contains.get(b_name, ())
+                for a_name, a_contents in contains.items()
+                for b_name in a_contents
+            )
         
         # Constraint 3: All qubits must be in some domain
         def qubits_in_domains(qubits, domains):
-            all_domain_states = set()
-            for domain in domains:
-                for state in domain.states:
-                    # Extract individual states from superposition
-                    if '⊕' in state:
-                        s1, s2 = state.split('⊕')
-                        all_domain_states.add(s1)
-                        all_domain_states.add(s2)
-                    else:
-                        all_domain_states.add(state)
+            all_domain_states = self._build_domain_states(domains)
             
             for qubit in qubits:
                 if qubit.state_a not in all_domain_states:
@@ -60,12 +57,19 @@ class AdmissibilityEngine:
             lambda s, q, d: qubits_in_domains(q, d)[0]
         ]
     
+    def reset(self):
+        """Forget accumulated checks and indices so the engine can be reused"""
+        self.structures.clear()
+        self.accumulation.clear()
+        self._clear_index()
+    
     def check_structure(self, program) -> Tuple[bool, str]:
         """
         Main admissibility check
         Returns: (is_admissible, reason_if_not)
         """
         reasons = []
+        program._admissible_revision = None  # set again only by _record_admissible
         
         # 1. Check boundary self-containment
         for boundary in program.boundaries:
@@ -73,37 +77,92 @@ class AdmissibilityEngine:
                 return False, f"Boundary '{boundary.name}' contains itself"
         
         # 2. Check circular containment
-        structures = {}
-        for boundary in program.boundaries:
-            structures[boundary.name] = set(boundary.content)
+        self._index_program(program)
         
-        if not self.constraints[1](structures):  # no_circular_containment
+        if not self.constraints[1](self._contains):  # no_circular_containment
             return False, "Circular containment detected"
         
         # 3. Check qubits are in domains
-        qubit_domain_check, qubit_reason = self._check_qubit_domains(
-            program.qubits, program.domains
-        )
+        qubit_domain_check, qubit_reason = self._check_qubit_domains(program)
         if not qubit_domain_check:
             return False, qubit_reason
         
-        # 4. Check all domains are inside some boundary
-        all_boundary_contents = set()
-        for boundary in program.boundaries:
-            all_boundary_contents.update(boundary.content)
+        # 4./5. Check all domains and qubits are inside some boundary
+        #       (index keys are exactly the names some boundary contains)
+        all_boundary_contents = self._contained_by.keys()
+        missing_domains = {d.name for d in program.domains} - all_boundary_contents
+        missing_qubits = {q.name for q in program.qubits} - all_boundary_contents
+        
+        if missing_domains or missing_qubits:
+            # Report in declaration order
+            for domain in program.domains:
+                if domain.name in missing_domains:
+                    reasons.append(f"Domain '{domain.name}' not contained in any boundary")
+            for qubit in program.qubits:
+                if qubit.name in missing_qubits:
+                    reasons.append(f"Qubit '{qubit.name}' not contained in any boundary")
+            return False, "; ".join(reasons)
+        
+        return self._record_admissible(program)
+    
+    def check_incremental(self, program, changed_names, base=None,
+                          added_boundaries=(), removed_names=()) -> Tuple[bool, str]:
+        """
+        Re-validate an admissible program after a local change
+        changed_names: boundaries added or removed, plus every name whose
+        containing boundaries changed. Domains and qubits must be unchanged.
+        base: optional program that program was derived from by dropping every
+        boundary named in removed_names and appending added_boundaries; the
+        indices are patched from it when they are current for base.
+        Returns: (is_admissible, reason_if_not)
+        """
+        program._admissible_revision = None  # set again only by _record_admissible
+        if base is not None and self._index_is_current(base):
+            self._patch_index(base, program, added_boundaries, set(removed_names))
+        elif not self._index_is_current(program):
+            self._index_program(program)
         
+        admissible, reason = self._check_changed(program, set(changed_names))
+        if not admissible:
+            self._clear_index()  # don't keep indices for a rejected program
+            return admissible, reason
+        
+        return self._record_admissible(program)
+    
+    def _check_changed(self, program, changed_names) -> Tuple[bool, str]:
+        """Constraints that a change to changed_names can break"""
+        # 1. Check changed boundaries for self-containment
+        for name in changed_names:
+            if name in self._contained_by.get(name, ()):
+                return False, f"Boundary '{name}' contains itself"
+        
+        # 2. Check circular containment on edges touching a changed name
+        for name in changed_names:
+            for item in self._contains.get(name, ()):
+                if name in self._contains.get(item, ()):
+                    return False, "Circular containment detected"
+        
+        # 3. Qubit states depend only on domains, which are unchanged
+        
+        # 4./5. Changed domains and qubits must still be inside some boundary
+        reasons = []
         for domain in program.domains:
-            if domain.name not in all_boundary_contents:
+            if domain.name in changed_names and not self._contained_by.get(domain.name):
                 reasons.append(f"Domain '{domain.name}' not contained in any boundary")
         
-        # 5. Check all qubits are inside some boundary
         for qubit in program.qubits:
-            if qubit.name not in all_boundary_contents:
+            if qubit.name in changed_names and not self._contained_by.get(qubit.name):
                 reasons.append(f"Qubit '{qubit.name}' not contained in any boundary")
         
         if reasons:
             return False, "; ".join(reasons)
         
+        return True, ""
+    
+    def _record_admissible(self, program) -> Tuple[bool, str]:
+        """Mark program admissible and record it in accumulation"""
+        program._admissible_revision = program._revision
+        
         # Record in accumulation (bookkeeping only)
         self.accumulation.append({
             'type': 'admissibility_check',
@@ -114,20 +173,76 @@ class AdmissibilityEngine:
         
         return True, "Structure is admissible"
     
-    def _check_qubit_domains(self, qubits, domains):
-        """Check all qubit states exist in domains"""
-        # Build set of all states in domains
+    def _index_is_current(self, program) -> bool:
+        """True if the indices were built from program's current boundaries"""
+        return (
+            self._indexed_program is program
+            and self._indexed_revision == program._revision
+        )
+    
+    def _clear_index(self):
+        """Drop the containment indices"""
+        self._contains = {}
+        self._contained_by = {}
+        self._indexed_program = None
+        self._indexed_revision = None
+    
+    def _index_program(self, program):
+        """Build containment indices from the program's boundaries"""
+        self._contains = {}
+        self._contained_by = {}
+        for boundary in program.boundaries:
+            self._contains[boundary.name] = set(boundary.content)
+            for item in boundary.content:
+                self._contained_by.setdefault(item, set()).add(boundary.name)
+        self._indexed_program = program
+        self._indexed_revision = program._revision
+    
+    def _patch_index(self, base, program, added_boundaries, removed_names):
+        """
+        Move indices from base to program, which differs from base only by
+        removed_names (every boundary with those names) and added_boundaries
+        (appended at the end). The indices must be current for base.
+        """
+        # 1. Drop edges of removed boundaries
+        for boundary in base.boundaries:
+            if boundary.name in removed_names:
+                for item in boundary.content:
+                    self._contained_by[item].discard(boundary.name)
+        for name in removed_names:
+            self._contains.pop(name, None)
+        
+        # 2. Add edges of appended boundaries (later declarations win)
+        for boundary in added_boundaries:
+            self._contains[boundary.name] = set(boundary.content)
+            for item in boundary.content:
+                self._contained_by.setdefault(item, set()).add(boundary.name)
+        
+        self._indexed_program = program
+        self._indexed_revision = program._revision
+    
+    def _build_domain_states(self, domains) -> Set[str]:
+        """Collect individual states from domains, splitting superpositions"""
         domain_states = set()
         for domain in domains:
             for state_str in domain.states:
-                if '⊕' in state_str:
-                    for state in state_str.split('⊕'):
-                        domain_states.add(state)
-                else:
-                    domain_states.add(state_str)
+                # split() yields the state itself when there is no ⊕
+                domain_states.update(state_str.split('⊕'))
+        return domain_states
+    
+    def _check_qubit_domains(self, program):
+        """Check all qubit states exist in domains"""
+        # Build set of all states in domains once per domains revision
+        revision = program._domains_revision
+        cache = program._domain_states_cache
+        if cache is None or cache[0] != revision:
+            cache = program._domain_states_cache = (
+                revision, self._build_domain_states(program.domains)
+            )
+        domain_states = cache[1]
         
         # Check each qubit
-        for qubit in qubits:
+        for qubit in program.qubits:
             if qubit.state_a not in domain_states:
                 return False, f"Qubit state '{qubit.state_a}' not in any domain"
             if qubit.state_b not in domain_states:
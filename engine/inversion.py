@@ -2,7 +2,8 @@
 Inversion Engine - ONLY dynamic operation allowed
 Atomic boundary ↔ content role swap
 """
-from copy import deepcopy
+import copy
+import hashlib
 
 class InversionEngine:
     """
@@ -13,6 +14,12 @@ class InversionEngine:
     def __init__(self, admissibility_engine):
         self.admissibility = admissibility_engine
         self.inversion_log = []
+        self._snapshots = []  # (replaced, added) boundaries per inversion
+    
+    def reset(self):
+        """Clear the inversion log so the engine can be reused"""
+        self.inversion_log.clear()
+        self._snapshots.clear()
     
     def invert(self, program, boundary_name):
         """
@@ -20,9 +27,11 @@ class InversionEngine:
         Returns: (new_program, success, reason)
         """
         # 1. Verify structure is admissible BEFORE inversion
-        admissible, reason = self.admissibility.check_structure(program)
-        if not admissible:
-            return program, False, f"Cannot invert inadmissible structure: {reason}"
+        #    (already known for programs unchanged since passing a check)
+        if not getattr(program, '_admissible', False):
+            admissible, reason = self.admissibility.check_structure(program)
+            if not admissible:
+                return program, False, f"Cannot invert inadmissible structure: {reason}"
         
         # 2. Find the boundary to invert
         boundary_to_invert = None
@@ -34,31 +43,62 @@ class InversionEngine:
         if not boundary_to_invert:
             return program, False, f"Boundary '{boundary_name}' not found"
         
-        # 3. Create deep copy for inversion (atomic operation)
-        new_program = deepcopy(program)
+        # 3. Clone the mutated parts for inversion (atomic operation)
+        new_program = self._clone_for_inversion(program)
         
         # 4. Perform atomic swap: boundary becomes content, content becomes boundary
-        inverted_boundary = self._perform_atomic_swap(
-            new_program, boundary_to_invert
-        )
+        inverted_boundary = self._perform_atomic_swap(new_program, boundary_to_invert)
         
-        # 5. Verify admissibility AFTER inversion
-        admissible_after, reason_after = self.admissibility.check_structure(new_program)
+        # 5. Verify admissibility AFTER inversion - only swapped names changed
+        #    (every boundary with this name is removed by the swap, and one
+        #    boundary per content item is appended)
+        replaced = [b for b in program.boundaries if b.name == boundary_name]
+        changed_names = {boundary_name}
+        for boundary in replaced:
+            changed_names.update(boundary.content)
+        kept = len(new_program.boundaries) - len(boundary_to_invert.content)
+        added = new_program.boundaries[kept:]
+        admissible_after, reason_after = self.admissibility.check_incremental(
+            new_program, changed_names, base=program,
+            added_boundaries=added, removed_names={boundary_name}
+        )
         if not admissible_after:
             # Roll back - inversion failed
             return program, False, f"Inversion produced inadmissible structure: {reason_after}"
         
-        # 6. Log the inversion (bookkeeping ONLY)
+        # 6. Log the inversion (bookkeeping ONLY) - hashes of the boundaries
+        #    it replaced and added, so the log grows with the change only
+        before, after = self._snapshot(replaced), self._snapshot(added)
         self.inversion_log.append({
             'boundary': boundary_name,
-            'before': program,
-            'after': new_program,
+            'before_hash': self._structural_hash(before),
+            'after_hash': self._structural_hash(after),
             'atomic': True,
             'iterations': 0  # Always 0 - inversion is atomic
         })
+        self._snapshots.append((before, after))
         
         return new_program, True, "Inversion successful"
     
+    def _clone_for_inversion(self, program):
+        """
+        Copy only what inversion mutates: the structure lists.
+        The swap replaces boundaries rather than editing them, so the
+        boundaries, domains and qubits themselves stay shared.
+        """
+        new_program = copy.copy(program)
+        new_program._admissible_revision = None
+        new_program._domain_states_cache = program._domain_states_cache  # same domains
+        return new_program
+    
+    def _snapshot(self, boundaries):
+        """Immutable boundary structure: ((name, (content, ...)), ...)"""
+        return tuple((b.name, tuple(b.content)) for b in boundaries)
+    
+    def _structural_hash(self, snapshot):
+        """Stable hex digest of a boundary snapshot (same in every process)"""
+        return hashlib.blake2b(repr(snapshot).encode(), digest_size=16).hexdigest()
+    
     def _perform_atomic_swap(self, program, boundary):
         """
         Atomic operation: boundary ↔ content role swap
@@ -68,13 +108,14 @@ class InversionEngine:
         program.boundaries = [b for b in program.boundaries if b.name != boundary.name]
         
         # Create new boundaries from the content
-        for item_name in boundary.content:
-            # Each item in content becomes a new boundary containing the old boundary name
-            new_boundary = type(boundary)(
-                name=item_name,
-                content=[boundary.name]
-            )
-            program.boundaries.append(new_boundary)
+        # Each item in content becomes a new boundary containing the old boundary name
+        Boundary = type(boundary)
+        name = boundary.name
+        new_boundaries = [
+            Boundary(name=item_name, content=[name])
+            for item_name in boundary.content
+        ]
+        program.boundaries.extend(new_boundaries)
         
         # The old boundary name becomes regular content in the new boundaries
         # (Already handled above)
@@ -87,4 +128,11 @@ class InversionEngine:
     
     def get_inversion_history(self):
         """Return inversion log - READ ONLY"""
-        return self.inversion_log.copy()
\ No newline at end of file
+        return self.inversion_log.copy()
+    
+    def get_inversion_history_snapshots(self):
+        """Return the boundaries each inversion replaced/added - READ ONLY"""
+        return [
+            {'boundary': entry['boundary'], 'before': before, 'after': after}
+            for entry, (before, after) in zip(self.inversion_log, self._snapshots)
+        ]
\ No newline at end of file
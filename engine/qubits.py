@@ -2,16 +2,17 @@
 Structural Qubits - Classical implementation of quantum concepts
 Non-local, non-probabilistic, collapse only via inversion
 """
-from dataclasses import dataclass
-from typing import Set, List
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, List
+from qgl._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StructuralQubit:
     """A QGL qubit: {A ⊕ B} - unresolved superposition"""
     name: str
     state_a: str
     state_b: str
-    entangled_with: Set[str] = None  # Names of other qubits
+    entangled_with: Set[str] = field(default_factory=set)  # Names of other qubits
     
     def __post_init__(self):
         if self.entangled_with is None:
@@ -45,11 +46,19 @@ class QubitRegistry:
     
     def __init__(self):
         self.qubits: Dict[str, StructuralQubit] = {}
-        self.entanglement_groups: List[Set[str]] = []
+        
+        # Entanglement groups as a union-find forest
+        self._parent: Dict[str, str] = {}
+        self._size: Dict[str, int] = {}
+        self._groups_cache: Optional[Dict[str, Set[str]]] = None  # root -> members
     
     def register_qubit(self, qubit):
         """Register a qubit in global registry"""
         self.qubits[qubit.name] = qubit
+        if qubit.name not in self._parent:
+            self._parent[qubit.name] = qubit.name
+            self._size[qubit.name] = 1
+            self._groups_cache = None
     
     def create_entanglement(self, qubit_name_1, qubit_name_2):
         """Create entanglement between two qubits"""
@@ -58,28 +67,46 @@ class QubitRegistry:
             self.qubits[qubit_name_2].entangle_with(qubit_name_1)
             
             # Update entanglement groups
-            self._update_entanglement_groups(qubit_name_1, qubit_name_2)
+            self._union(qubit_name_1, qubit_name_2)
     
-    def _update_entanglement_groups(self, q1, q2):
-        """Update global entanglement groups"""
-        found_group = None
-        for group in self.entanglement_groups:
-            if q1 in group or q2 in group:
-                found_group = group
-                break
-        
-        if found_group:
-            found_group.add(q1)
-            found_group.add(q2)
-        else:
-            self.entanglement_groups.append({q1, q2})
+    def _find(self, name):
+        """Root of the group containing name (with path halving)"""
+        parent = self._parent
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+    
+    def _union(self, q1, q2):
+        """Merge the groups of q1 and q2 (union by size)"""
+        root_1, root_2 = self._find(q1), self._find(q2)
+        if root_1 == root_2:
+            return
+        if self._size[root_1] < self._size[root_2]:
+            root_1, root_2 = root_2, root_1
+        self._parent[root_2] = root_1
+        self._size[root_1] += self._size.pop(root_2)
+        self._groups_cache = None
+    
+    def _groups(self):
+        """Materialize root -> members, cached until the next union"""
+        if self._groups_cache is None:
+            groups = {}
+            for name in self._parent:
+                groups.setdefault(self._find(name), set()).add(name)
+            self._groups_cache = groups
+        return self._groups_cache
+    
+    @property
+    def entanglement_groups(self) -> List[Set[str]]:
+        """All groups with at least one entanglement"""
+        return [group.copy() for group in self._groups().values() if len(group) > 1]
     
     def get_entanglement_group(self, qubit_name):
         """Get all qubits entangled with given qubit"""
-        for group in self.entanglement_groups:
-            if qubit_name in group:
-                return group.copy()
-        return {qubit_name}
+        if qubit_name not in self._parent:
+            return {qubit_name}
+        return self._groups()[self._find(qubit_name)].copy()
     
     def collapse_entangled_group(self, group, choices):
         """
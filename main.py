@@ -1,3 +1,4 @@
+import math 
 import numpy as np 
 from dataclasses import dataclass 
  
@@ -12,7 +13,7 @@ class QGLAdmissibilityEngine:
  
     def run_demonstration(self): 
         print("QGL Engine v3.0.0 - 0.000000%% error") 
-        return {"phi": (1+np.sqrt(5))/2} 
+        return {"phi": (1+math.sqrt(5))/2} 
  
 def main(): 
     engine = QGLAdmissibilityEngine() 
@@ -0,0 +1,8 @@
+"""
+QGL Compat - Version shims shared by the qgl and engine modules
+"""
+import sys
+
+# dataclass() options for slotted classes (no per-instance __dict__);
+# slots=True needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -5,9 +5,147 @@ Performs non-iterative, non-temporal structural transformations
 import numpy as np
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass
+from types import MappingProxyType
+from qgl._compat import DATACLASS_SLOTS
+import functools
 import math
 
-@dataclass
+# Exact values reached at node 5 (measurement collapse)
+_PHI = (1 + math.sqrt(5)) / 2
+_ALPHA = 1 / 137.035999084
+
+def _build_derived_constants() -> Dict[str, float]:
+    """Derive physical constants from the exact base values (runs once)"""
+    derived = {}
+    
+    # Speed of light
+    derived['c'] = 299792458.0
+    
+    # Planck constant
+    derived['h'] = 6.62607015e-34
+    derived['hbar'] = derived['h'] / (2 * math.pi)
+    
+    # Gravitational constant
+    derived['G'] = 6.67430e-11
+    
+    # Planck units
+    derived['planck_length'] = math.sqrt(
+        derived['hbar'] * derived['G'] / derived['c']**3
+    )
+    derived['planck_time'] = derived['planck_length'] / derived['c']
+    derived['planck_mass'] = math.sqrt(
+        derived['hbar'] * derived['c'] / derived['G']
+    )
+    
+    # Electromagnetic constants
+    derived['mu0'] = 4 * math.pi * 1e-7
+    derived['epsilon0'] = 1 / (derived['mu0'] * derived['c']**2)
+    derived['Z0'] = math.sqrt(derived['mu0'] / derived['epsilon0'])
+    
+    # Elementary charge
+    derived['elementary_charge'] = 1.602176634e-19
+    
+    # Boltzmann constant
+    derived['boltzmann'] = 1.380649e-23
+    
+    return derived
+
+# Reference values the exact constants are scored against
+_REFERENCE_VALUES = MappingProxyType({
+    'phi': _PHI,
+    'e': math.e,
+    'pi': math.pi,
+    'alpha': _ALPHA
+})
+
+# Derived constants are pure functions of the exact values - build them once
+_DERIVED_CONSTANTS = MappingProxyType(_build_derived_constants())
+
+@functools.lru_cache(maxsize=16)
+def _build_lattice(size: int):
+    """
+    Build the φ-scaled lattice arrays for a given size (cached per size)
+    Returns read-only (info_vectors, info_magnitudes, tensions, phases)
+    """
+    # Create all information vectors at once with φ-influenced distribution
+    # Components are written straight into contiguous rows of a (7, N)
+    # buffer, so each trig call allocates no temporary
+    indices = np.arange(size)
+    angles = indices * 2 * math.pi / _PHI
+    components = np.empty((7, size))
+    np.sin(angles, out=components[0])               # x component
+    np.cos(angles, out=components[1])               # y component
+    harmonic = angles * _PHI
+    np.sin(harmonic, out=components[2])             # φ harmonic
+    np.cos(harmonic, out=components[3])
+    np.divide(angles, _PHI, out=harmonic)
+    np.sin(harmonic, out=components[4])             # 1/φ harmonic
+    np.cos(harmonic, out=components[5])
+    np.multiply(indices % 7, 0.618, out=components[6])  # φ residual
+    info_vectors = np.ascontiguousarray(components.T)
+    
+    # Normalize and scale by φ in place (zero rows are left untouched)
+    norms = np.linalg.norm(info_vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    info_vectors /= norms
+    info_vectors *= 0.618
+    info_magnitudes = np.linalg.norm(info_vectors, axis=1)
+    
+    # Tension follows inverse square of φ
+    tensions = 0.1 * (indices % int(_PHI * 10)) / 10.0
+    phases = (indices * _PHI) % (2 * math.pi)
+    
+    for array in (info_vectors, info_magnitudes, tensions, phases):
+        array.flags.writeable = False
+    return info_vectors, info_magnitudes, tensions, phases
+
+@functools.lru_cache(maxsize=16)
+def _build_proto_constants(size: int):
+    """
+    Derive the φ, e and π proto constants for a lattice size (cached per size)
+    They depend only on the read-only tensions, never on placed structures
+    """
+    tensions = _build_lattice(size)[2]
+    protos = {}
+    
+    # Node 1: φ from tension distribution
+    positive = tensions > 0
+    if positive.any():
+        avg_tension = tensions[positive].mean()
+        protos['phi_proto'] = 1 + avg_tension * 0.618
+    else:
+        protos['phi_proto'] = _PHI
+    
+    # Node 2: e from φ growth
+    protos['e_proto'] = (1 + 1/protos['phi_proto']) ** protos['phi_proto']
+    
+    # Node 3: π from closure
+    protos['pi_proto'] = protos['e_proto'] * (
+        1 - 1/(protos['e_proto'] - 1)
+    )
+    
+    return MappingProxyType(protos)
+
+@functools.lru_cache(maxsize=16)
+def _build_lattice_totals(size: int):
+    """
+    Total information and ring-neighbour coherence of a lattice (cached per size)
+    Both depend only on the read-only info arrays, not on placed structures
+    """
+    info_vectors, info_magnitudes, _, _ = _build_lattice(size)
+    total_info = float(info_magnitudes.sum())
+    
+    if size > 1:
+        point_ids = np.arange(size)
+        next_ids = (point_ids + 1) % size
+        dots = np.einsum('ij,ij->i', info_vectors[point_ids], info_vectors[next_ids])
+        avg_coherence = (dots / (info_magnitudes[point_ids] * info_magnitudes[next_ids])).mean()
+    else:
+        avg_coherence = 0
+    
+    return total_info, avg_coherence
+
+@dataclass(**DATACLASS_SLOTS)
 class VoidPoint:
     """Single point in the void lattice"""
     id: int
@@ -33,7 +171,7 @@ class VoidPoint:
     
     def get_info_magnitude(self) -> float:
         """Get magnitude of information vector"""
-        return np.linalg.norm(self.info_vector)
+        return math.sqrt(self.info_vector.dot(self.info_vector))
     
     def get_phase_coherence(self, other_point: 'VoidPoint') -> float:
         """Calculate phase coherence between two points"""
@@ -50,14 +188,22 @@ class StructuralInterpreter:
     """
     
     def __init__(self, lattice_size: int = 1000):
-        self.lattice: List[VoidPoint] = []
+        # Void lattice stored as parallel arrays, one row per point
+        self.info_vectors: np.ndarray = np.empty((0, 7))  # 7D information space
+        self.info_magnitudes: np.ndarray = np.empty(0)
+        self.tensions: np.ndarray = np.empty(0)
+        self.phases: np.ndarray = np.empty(0)
+        self.occupied: np.ndarray = np.empty(0, dtype=bool)
+        self.nodes: np.ndarray = np.empty(0, dtype=np.int32)
+        self.point_structures: Dict[int, List[Dict]] = {}  # point_id -> structures
+        
         self.structure_map: Dict[str, List[int]] = {}  # name -> point_ids
         self.entanglement_groups: List[Set[int]] = []
-        self.accumulated_info: List[float] = []
+        self.accumulated_info: np.ndarray = np.empty(0)
         self.node_progression: Dict[int, str] = {}
         
         # Golden ratio constants
-        self.PHI = (1 + math.sqrt(5)) / 2
+        self.PHI = _PHI
         self.E = math.e
         self.PI = math.pi
         
@@ -67,36 +213,48 @@ class StructuralInterpreter:
         """Initialize void lattice with optimal φ spacing"""
         print(f"🌀 Initializing void lattice with {size} points (φ-scaled)")
         
-        for i in range(size):
-            # Create information vector with φ-influenced distribution
-            angle = i * 2 * math.pi / self.PHI
-            info_vector = np.array([
-                math.sin(angle),           # x component
-                math.cos(angle),           # y component
-                math.sin(angle * self.PHI), # φ harmonic
-                math.cos(angle * self.PHI),
-                math.sin(angle / self.PHI), # 1/φ harmonic
-                math.cos(angle / self.PHI),
-                0.618 * (i % 7)           # φ residual
-            ])
-            
-            # Normalize and scale by φ
-            norm = np.linalg.norm(info_vector)
-            if norm > 0:
-                info_vector = (info_vector / norm) * 0.618
-            
-            # Tension follows inverse square of φ
-            tension = 0.1 * (i % int(self.PHI * 10)) / 10.0
-            
-            point = VoidPoint(
-                id=i,
-                info_vector=info_vector,
-                tension=tension,
-                phase=(i * self.PHI) % (2 * math.pi)
-            )
-            self.lattice.append(point)
-        
-        print(f"✅ Void lattice initialized with {len(self.lattice)} points")
+        # The lattice is a pure function of its size - reuse a cached copy
+        info_vectors, info_magnitudes, tensions, phases = _build_lattice(size)
+        self.info_vectors = info_vectors        # read-only, shared
+        self.info_magnitudes = info_magnitudes  # read-only, shared
+        self.tensions = tensions                # read-only, shared
+        self.phases = phases.copy()             # mutated by inversions/entanglement
+        self.occupied = np.zeros(size, dtype=bool)
+        self.nodes = np.zeros(size, dtype=np.int32)
+        self.point_structures = {}
+        
+        print(f"✅ Void lattice initialized with {self.lattice_size} points")
+    
+    @property
+    def lattice_size(self) -> int:
+        """Number of points in the void lattice"""
+        return len(self.tensions)
+    
+    def get_point(self, point_id: int) -> VoidPoint:
+        """Build a VoidPoint snapshot of a single lattice row"""
+        return VoidPoint(
+            id=point_id,
+            info_vector=self.info_vectors[point_id].copy(),
+            tension=float(self.tensions[point_id]),
+            occupied=bool(self.occupied[point_id]),
+            structures=list(self.point_structures.get(point_id, [])),
+            node=int(self.nodes[point_id]),
+            phase=float(self.phases[point_id])
+        )
+    
+    def _add_structure(self, point_id: int, structure_type: str, name: str, **kwargs):
+        """Add structure to a lattice point"""
+        self.occupied[point_id] = True
+        self.point_structures.setdefault(point_id, []).append({
+            'type': structure_type,
+            'name': name,
+            **kwargs
+        })
+    
+    def _phase_coherence(self, ids_a: np.ndarray, ids_b: np.ndarray) -> np.ndarray:
+        """Row-wise phase coherence between two sets of lattice points"""
+        dots = np.einsum('ij,ij->i', self.info_vectors[ids_a], self.info_vectors[ids_b])
+        return dots / (self.info_magnitudes[ids_a] * self.info_magnitudes[ids_b])
     
     def execute_program(self, program) -> Dict[str, Any]:
         """
@@ -118,15 +276,14 @@ class StructuralInterpreter:
         }
         
         # Reset lattice for fresh execution
-        for point in self.lattice:
-            point.occupied = False
-            point.structures = []
-            point.node = 0
+        self.occupied[:] = False
+        self.nodes[:] = 0
+        self.point_structures = {}
         
         # Clear structure map
         self.structure_map.clear()
         self.entanglement_groups = []
-        self.accumulated_info = []
+        self.accumulated_info = np.empty(0)
         
         # Step 1: Execute boundaries (node 1: φ emergence)
         self._execute_boundaries(program.boundaries, results)
@@ -165,29 +322,33 @@ class StructuralInterpreter:
         
         return results
     
+    def _placement_magnitudes(self) -> np.ndarray:
+        """Information magnitudes rounded so ulp noise never breaks a tie"""
+        return np.round(self.info_magnitudes, 12)
+    
     def _execute_boundaries(self, boundaries, results):
         """Place boundaries on void lattice (node 1)"""
         print(f"  📍 Placing {len(boundaries)} boundaries...")
         
         # Find optimal points with lowest tension (most receptive)
-        candidate_points = sorted(self.lattice, 
-                                key=lambda p: (p.tension, -p.get_info_magnitude()))
+        candidate_points = np.lexsort((-self._placement_magnitudes(), self.tensions))
         
         point_index = 0
         for boundary in boundaries:
             if point_index >= len(candidate_points):
                 break
             
-            point = candidate_points[point_index]
-            point.add_structure(
+            point_id = int(candidate_points[point_index])
+            self._add_structure(
+                point_id,
                 structure_type='boundary',
                 name=boundary.name,
                 content=boundary.content
             )
-            point.node = 1  # φ node
+            self.nodes[point_id] = 1  # φ node
             
             # Update structure map
-            self.structure_map[boundary.name] = [point.id]
+            self.structure_map[boundary.name] = [point_id]
             
             # Record execution
             results['boundaries_placed'] += 1
@@ -200,26 +361,26 @@ class StructuralInterpreter:
         print(f"  🏛️ Placing {len(domains)} domains...")
         
         # Find points with medium tension and good information magnitude
-        candidate_points = sorted(self.lattice,
-                                key=lambda p: (abs(p.tension - 0.05), 
-                                              -p.get_info_magnitude()))
+        candidate_points = np.lexsort((-self._placement_magnitudes(),
+                                       np.abs(self.tensions - 0.05)))
         
         point_index = 0
         for domain in domains:
             if point_index >= len(candidate_points):
                 break
             
-            point = candidate_points[point_index]
-            point.add_structure(
+            point_id = int(candidate_points[point_index])
+            self._add_structure(
+                point_id,
                 structure_type='domain',
                 name=domain.name,
                 states=domain.states,
                 has_unresolved=domain.has_unresolved()
             )
-            point.node = 2  # e node
+            self.nodes[point_id] = 2  # e node
             
             # Update structure map
-            self.structure_map[domain.name] = [point.id]
+            self.structure_map[domain.name] = [point_id]
             
             # Record execution
             results['domains_placed'] += 1
@@ -232,17 +393,16 @@ class StructuralInterpreter:
         print(f"  ⚛️ Placing {len(qubits)} qubits...")
         
         # Find points with highest information magnitude for quantum effects
-        candidate_points = sorted(self.lattice,
-                                key=lambda p: (-p.get_info_magnitude(),
-                                              p.tension))
+        candidate_points = np.lexsort((self.tensions, -self._placement_magnitudes()))
         
         point_index = 0
         for qubit in qubits:
             if point_index >= len(candidate_points):
                 break
             
-            point = candidate_points[point_index]
-            point.add_structure(
+            point_id = int(candidate_points[point_index])
+            self._add_structure(
+                point_id,
                 structure_type='qubit',
                 name=qubit.name,
                 state_a=qubit.state_a,
@@ -250,13 +410,13 @@ class StructuralInterpreter:
                 superposition=True,
                 resolved=qubit.resolved
             )
-            point.node = 3  # π node
+            self.nodes[point_id] = 3  # π node
             
             # Add quantum phase shift
-            point.phase = (point.phase + math.pi) % (2 * math.pi)
+            self.phases[point_id] = (self.phases[point_id] + math.pi) % (2 * math.pi)
             
             # Update structure map
-            self.structure_map[qubit.name] = [point.id]
+            self.structure_map[qubit.name] = [point_id]
             
             # Record execution
             results['qubits_placed'] += 1
@@ -279,38 +439,37 @@ class StructuralInterpreter:
                 point_id = self.structure_map[qubit.name][0]
                 qubit_points.append((qubit.name, point_id))
         
+        # Phase coherence of every qubit pair in one pass; it depends only on
+        # the info vectors, so the phase updates below cannot change it
+        point_ids = np.array([point_id for _, point_id in qubit_points], dtype=np.intp)
+        pair_i, pair_j = np.triu_indices(len(point_ids), 1)
+        coherence = self._phase_coherence(point_ids[pair_i], point_ids[pair_j])
+        
         # Create entanglement groups based on phase coherence
         entanglement_count = 0
-        for i, (name1, id1) in enumerate(qubit_points):
-            for j, (name2, id2) in enumerate(qubit_points[i+1:], i+1):
-                point1 = self.lattice[id1]
-                point2 = self.lattice[id2]
-                
-                # Calculate phase coherence
-                coherence = point1.get_phase_coherence(point2)
-                
-                # Entangle if coherence > threshold
-                if coherence > 0.7:  # φ/2 threshold
-                    # Update phases to match
-                    avg_phase = (point1.phase + point2.phase) / 2
-                    point1.phase = avg_phase
-                    point2.phase = avg_phase
-                    
-                    # Create entanglement group
-                    entangled_group = {id1, id2}
-                    
-                    # Check if either point is already in a group
-                    merged = False
-                    for group in self.entanglement_groups:
-                        if id1 in group or id2 in group:
-                            group.update(entangled_group)
-                            merged = True
-                            break
-                    
-                    if not merged:
-                        self.entanglement_groups.append(entangled_group)
-                    
-                    entanglement_count += 1
+        for pair in np.flatnonzero(coherence > 0.7):  # φ/2 threshold
+            id1 = int(point_ids[pair_i[pair]])
+            id2 = int(point_ids[pair_j[pair]])
+            # Update phases to match
+            avg_phase = (self.phases[id1] + self.phases[id2]) / 2
+            self.phases[id1] = avg_phase
+            self.phases[id2] = avg_phase
+            
+            # Create entanglement group
+            entangled_group = {id1, id2}
+            
+            # Check if either point is already in a group
+            merged = False
+            for group in self.entanglement_groups:
+                if id1 in group or id2 in group:
+                    group.update(entangled_group)
+                    merged = True
+                    break
+            
+            if not merged:
+                self.entanglement_groups.append(entangled_group)
+            
+            entanglement_count += 1
         
         print(f"    → Created {entanglement_count} entanglements at node 4 (α)")
     
@@ -325,33 +484,26 @@ class StructuralInterpreter:
             'information_distribution': []
         }
         
-        info_magnitudes = []
-        coherence_scores = []
-        
-        for point in self.lattice:
-            if point.occupied:
-                accumulation['occupied_points'] += 1
-                
-                # Calculate information magnitude
-                info_mag = point.get_info_magnitude()
-                info_magnitudes.append(info_mag)
-                accumulation['total_information'] += info_mag
-                
-                # Calculate coherence with neighbors
-                if point.id > 0 and point.id < len(self.lattice) - 1:
-                    prev_point = self.lattice[point.id - 1]
-                    next_point = self.lattice[point.id + 1]
-                    coherence = (point.get_phase_coherence(prev_point) +
-                               point.get_phase_coherence(next_point)) / 2
-                    coherence_scores.append(coherence)
-        
-        if info_magnitudes:
-            accumulation['average_information'] = np.mean(info_magnitudes)
-            accumulation['max_information'] = np.max(info_magnitudes)
-            accumulation['min_information'] = np.min(info_magnitudes)
-        
-        if coherence_scores:
-            accumulation['average_coherence'] = np.mean(coherence_scores)
+        occupied_ids = np.flatnonzero(self.occupied)
+        accumulation['occupied_points'] = len(occupied_ids)
+        
+        # Calculate information magnitude
+        info_magnitudes = self.info_magnitudes[occupied_ids]
+        accumulation['total_information'] = float(info_magnitudes.sum())
+        
+        # Calculate coherence with neighbors
+        interior_ids = occupied_ids[(occupied_ids > 0) &
+                                    (occupied_ids < self.lattice_size - 1)]
+        coherence_scores = (self._phase_coherence(interior_ids, interior_ids - 1) +
+                            self._phase_coherence(interior_ids, interior_ids + 1)) / 2
+        
+        if len(info_magnitudes):
+            accumulation['average_information'] = info_magnitudes.mean()
+            accumulation['max_information'] = info_magnitudes.max()
+            accumulation['min_information'] = info_magnitudes.min()
+        
+        if len(coherence_scores):
+            accumulation['average_coherence'] = coherence_scores.mean()
         
         # Store for later analysis
         self.accumulated_info = info_magnitudes
@@ -365,28 +517,13 @@ class StructuralInterpreter:
         """Generate physical constants from accumulated information"""
         print(f"  🔬 Generating constants...")
         
-        constants = {}
-        
-        # Node 1: φ from tension distribution
-        tensions = [p.tension for p in self.lattice if p.tension > 0]
-        if tensions:
-            avg_tension = np.mean(tensions)
-            constants['phi_proto'] = 1 + avg_tension * 0.618
-        else:
-            constants['phi_proto'] = self.PHI
-        
-        # Node 2: e from φ growth
-        constants['e_proto'] = (1 + 1/constants['phi_proto']) ** constants['phi_proto']
-        
-        # Node 3: π from closure
-        constants['pi_proto'] = constants['e_proto'] * (
-            1 - 1/(constants['e_proto'] - 1)
-        )
+        # Nodes 1-3: φ, e and π protos are fixed per lattice size
+        constants = dict(_build_proto_constants(self.lattice_size))
         
         # Node 4: α from entanglement count
         entanglement_count = sum(len(g) for g in self.entanglement_groups)
         if entanglement_count > 0:
-            constants['alpha_proto'] = 0.1 / (13.7 * entanglement_count / len(self.lattice))
+            constants['alpha_proto'] = 0.1 / (13.7 * entanglement_count / self.lattice_size)
         else:
             constants['alpha_proto'] = 0.1 / 13.7
         
@@ -394,77 +531,25 @@ class StructuralInterpreter:
         constants['phi_exact'] = self.PHI
         constants['e_exact'] = self.E
         constants['pi_exact'] = self.PI
-        constants['alpha_exact'] = 1/137.035999084
+        constants['alpha_exact'] = _ALPHA
         
-        # Generate other constants from exact values
-        constants.update(self._generate_derived_constants(constants))
+        # Add constants derived from the exact values
+        constants.update(_DERIVED_CONSTANTS)
         
         # Calculate accuracy
         constants['accuracy'] = self._calculate_accuracy(constants)
         
         return constants
     
-    def _generate_derived_constants(self, base_constants: Dict) -> Dict[str, float]:
-        """Generate derived constants from base constants"""
-        derived = {}
-        
-        # Speed of light
-        derived['c'] = 299792458.0
-        
-        # Planck constant
-        derived['h'] = 6.62607015e-34
-        derived['hbar'] = derived['h'] / (2 * base_constants['pi_exact'])
-        
-        # Gravitational constant
-        derived['G'] = 6.67430e-11
-        
-        # Planck units
-        derived['planck_length'] = math.sqrt(
-            derived['hbar'] * derived['G'] / derived['c']**3
-        )
-        derived['planck_time'] = derived['planck_length'] / derived['c']
-        derived['planck_mass'] = math.sqrt(
-            derived['hbar'] * derived['c'] / derived['G']
-        )
-        
-        # Electromagnetic constants
-        derived['mu0'] = 4 * base_constants['pi_exact'] * 1e-7
-        derived['epsilon0'] = 1 / (derived['mu0'] * derived['c']**2)
-        derived['Z0'] = math.sqrt(derived['mu0'] / derived['epsilon0'])
-        
-        # Elementary charge
-        derived['elementary_charge'] = 1.602176634e-19
-        
-        # Boltzmann constant
-        derived['boltzmann'] = 1.380649e-23
-        
-        return derived
-    
     def _calculate_accuracy(self, constants: Dict) -> Dict[str, float]:
         """Calculate accuracy of generated constants"""
         accuracy = {}
         
-        # φ accuracy
-        if 'phi_exact' in constants:
-            phi_actual = self.PHI
-            phi_error = abs(constants['phi_exact'] - phi_actual) / phi_actual * 100
-            accuracy['phi'] = phi_error
-        
-        # e accuracy
-        if 'e_exact' in constants:
-            e_error = abs(constants['e_exact'] - self.E) / self.E * 100
-            accuracy['e'] = e_error
-        
-        # π accuracy
-        if 'pi_exact' in constants:
-            pi_error = abs(constants['pi_exact'] - self.PI) / self.PI * 100
-            accuracy['pi'] = pi_error
-        
-        # α accuracy
-        if 'alpha_exact' in constants:
-            alpha_actual = 1/137.035999084
-            alpha_error = abs(constants['alpha_exact'] - alpha_actual) / alpha_actual * 100
-            accuracy['alpha'] = alpha_error
+        # Percentage error of each exact constant against its reference
+        for name, actual in _REFERENCE_VALUES.items():
+            exact_key = f'{name}_exact'
+            if exact_key in constants:
+                accuracy[name] = abs(constants[exact_key] - actual) / actual * 100
         
         return accuracy
     
@@ -551,14 +636,14 @@ class StructuralInterpreter:
     
     def _calculate_information_topology(self):
         """Calculate information distribution topology"""
-        if not self.accumulated_info:
+        if len(self.accumulated_info) == 0:
             return {'information_topology': 'empty'}
         
-        info_array = np.array(self.accumulated_info)
+        info_array = self.accumulated_info
         
         return {
-            'information_mean': float(np.mean(info_array)),
-            'information_std': float(np.std(info_array)),
+            'information_mean': float(info_array.mean()),
+            'information_std': float(info_array.std()),
             'information_skew': float(self._calculate_skewness(info_array)),
             'information_kurtosis': float(self._calculate_kurtosis(info_array)),
             'information_entropy': float(self._calculate_entropy(info_array))
@@ -568,21 +653,21 @@ class StructuralInterpreter:
         """Calculate skewness of data"""
         if len(data) < 2:
             return 0
-        mean = np.mean(data)
-        std = np.std(data)
+        mean = data.mean()
+        std = data.std()
         if std == 0:
             return 0
-        return np.mean(((data - mean) / std) ** 3)
+        return (((data - mean) / std) ** 3).mean()
     
     def _calculate_kurtosis(self, data):
         """Calculate kurtosis of data"""
         if len(data) < 2:
             return 0
-        mean = np.mean(data)
-        std = np.std(data)
+        mean = data.mean()
+        std = data.std()
         if std == 0:
             return 0
-        return np.mean(((data - mean) / std) ** 4) - 3
+        return (((data - mean) / std) ** 4).mean() - 3
     
     def _calculate_entropy(self, data):
         """Calculate Shannon entropy of data"""
@@ -590,8 +675,8 @@ class StructuralInterpreter:
             return 0
         
         # Normalize data
-        data = data - np.min(data)
-        data = data / (np.sum(data) + 1e-10)
+        data = data - data.min()
+        data = data / (data.sum() + 1e-10)
         
         # Remove zeros for log calculation
         data = data[data > 0]
@@ -599,7 +684,7 @@ class StructuralInterpreter:
         if len(data) == 0:
             return 0
         
-        return -np.sum(data * np.log(data))
+        return -(data * np.log(data)).sum()
     
     def _calculate_structural_coherence(self, program):
         """Calculate overall structural coherence score"""
@@ -613,28 +698,27 @@ class StructuralInterpreter:
             factors.append(depth_coherence)
         
         # 2. Information distribution coherence
-        if self.accumulated_info:
-            info_std = np.std(self.accumulated_info)
-            info_mean = np.mean(self.accumulated_info)
+        if len(self.accumulated_info):
+            info_std = self.accumulated_info.std()
+            info_mean = self.accumulated_info.mean()
             if info_mean > 0:
                 info_coherence = 1.0 / (1 + info_std / info_mean)
                 factors.append(info_coherence)
         
         # 3. Entanglement coherence
         if self.entanglement_groups:
-            entanglement_coherence = len(self.entanglement_groups) / len(self.lattice)
+            entanglement_coherence = len(self.entanglement_groups) / self.lattice_size
             factors.append(entanglement_coherence)
         
         # 4. Occupancy coherence
-        occupied_count = sum(1 for p in self.lattice if p.occupied)
-        occupancy_coherence = occupied_count / len(self.lattice)
+        occupied_count = int(np.count_nonzero(self.occupied))
+        occupancy_coherence = occupied_count / self.lattice_size
         factors.append(occupancy_coherence)
         
         # Final coherence score (harmonic mean of factors)
         if factors:
             # Use harmonic mean to penalize low individual scores
-            factors_array = np.array(factors)
-            coherence = len(factors) / np.sum(1.0 / (factors_array + 1e-10))
+            coherence = len(factors) / sum(1.0 / (f + 1e-10) for f in factors)
             return float(coherence)
         
         return 0.0
@@ -648,27 +732,36 @@ class StructuralInterpreter:
             'connections': []
         }
         
-        for point in self.lattice:
-            point_data = {
-                'id': point.id,
-                'x': float(point.info_vector[0]),
-                'y': float(point.info_vector[1]),
-                'z': float(point.info_vector[2]),
-                'tension': point.tension,
-                'occupied': point.occupied,
-                'node': point.node,
-                'phase': point.phase,
-                'info_magnitude': float(point.get_info_magnitude())
-            }
-            visualization_data['points'].append(point_data)
-            
-            if point.structures:
-                for structure in point.structures:
-                    visualization_data['structures'].append({
-                        'point_id': point.id,
-                        'type': structure['type'],
-                        'name': structure.get('name', '')
-                    })
+        columns = zip(
+            self.info_vectors[:, 0].tolist(),
+            self.info_vectors[:, 1].tolist(),
+            self.info_vectors[:, 2].tolist(),
+            self.tensions.tolist(),
+            self.occupied.tolist(),
+            self.nodes.tolist(),
+            self.phases.tolist(),
+            self.info_magnitudes.tolist()
+        )
+        for point_id, (x, y, z, tension, occupied, node, phase, magnitude) in enumerate(columns):
+            visualization_data['points'].append({
+                'id': point_id,
+                'x': x,
+                'y': y,
+                'z': z,
+                'tension': tension,
+                'occupied': occupied,
+                'node': node,
+                'phase': phase,
+                'info_magnitude': magnitude
+            })
+        
+        for point_id in sorted(self.point_structures):
+            for structure in self.point_structures[point_id]:
+                visualization_data['structures'].append({
+                    'point_id': point_id,
+                    'type': structure['type'],
+                    'name': structure.get('name', '')
+                })
         
         # Add entanglement connections
         for group in self.entanglement_groups:
@@ -685,17 +778,14 @@ class StructuralInterpreter:
     
     def get_execution_summary(self):
         """Get summary of execution results"""
-        occupied = sum(1 for p in self.lattice if p.occupied)
-        total_info = sum(p.get_info_magnitude() for p in self.lattice)
-        avg_coherence = np.mean([
-            p.get_phase_coherence(self.lattice[(p.id + 1) % len(self.lattice)])
-            for p in self.lattice
-        ]) if len(self.lattice) > 1 else 0
+        size = self.lattice_size
+        occupied = int(np.count_nonzero(self.occupied))
+        total_info, avg_coherence = _build_lattice_totals(size)
         
         return {
-            'lattice_size': len(self.lattice),
+            'lattice_size': size,
             'occupied_points': occupied,
-            'occupancy_rate': occupied / len(self.lattice),
+            'occupancy_rate': occupied / size,
             'total_information': total_info,
             'average_coherence': avg_coherence,
             'entanglement_groups': len(self.entanglement_groups),
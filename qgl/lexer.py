@@ -36,93 +36,103 @@ class QGLLexer:
         ('COMMENT', r'//.*'),
     ]
     
+    # All patterns as one alternation; earlier patterns win, as in TOKEN_PATTERNS
+    _TOKEN_RE = re.compile('|'.join(
+        f'(?P<{token_type}>{pattern})' for token_type, pattern in TOKEN_PATTERNS
+    ))
+    
+    # Any forbidden token as a whole word
+    _FORBIDDEN_RE = re.compile(
+        r'\b(' + '|'.join(
+            re.escape(token) for token in sorted(FORBIDDEN_TOKENS, key=len, reverse=True)
+        ) + r')\b'
+    )
+    
+    _COMMENT_RE = re.compile(r'//[^\n]*')
+    
+    # Common quantum notation variations, compiled once
+    _QUANTUM_REPLACEMENTS = [
+        (re.compile(pattern), replacement) for pattern, replacement in [
+            (r'\|0\s*\>', '|0⟩'),      # |0> → |0⟩
+            (r'\|1\s*\>', '|1⟩'),      # |1> → |1⟩
+            (r'\|\+\s*\>', '|+⟩'),     # |+> → |+⟩
+            (r'\|\-\s*\>', '|-⟩'),     # |-> → |-⟩
+            (r'\|↑\s*\>', '|↑⟩'),      # |↑> → |↑⟩
+            (r'\|↓\s*\>', '|↓⟩'),      # |↓> → |↓⟩
+            (r'\|ψ\s*\>', '|ψ⟩'),      # |ψ> → |ψ⟩
+            (r'\|φ\s*\>', '|φ⟩'),      # |φ> → |φ⟩
+            (r'\|α\s*\>', '|α⟩'),      # |α> → |α⟩
+            (r'\|β\s*\>', '|β⟩'),      # |β> → |β⟩
+            (r'\|\s*0\s*\⟩', '|0⟩'),   # Clean up spaces
+            (r'\|\s*1\s*\⟩', '|1⟩'),
+            (r'\|\s*\+\s*\⟩', '|+⟩'),
+            (r'\|\s*\-\s*\⟩', '|-⟩'),
+        ]
+    ]
+    
     def __init__(self):
         self.tokens = []
         self.position = 0
     
     def tokenize(self, code):
-        """Tokenize QGL code, rejecting forbidden syntax immediately"""
+        """
+        Tokenize QGL code, rejecting forbidden syntax immediately
+        code: str, or UTF-8 bytes-like (bytes, memoryview, mmap)
+        """
         self.tokens = []
         self.position = 0
         
+        if not isinstance(code, str):
+            code = str(code, 'utf-8')
+        
         # Pre-process: Handle common quantum notation variations
         # Replace |0> with |0⟩, |1> with |1⟩, etc. for consistency
         code = self._normalize_quantum_notation(code)
         
         # Remove comments first (anything after //)
-        lines = code.split('\n')
-        clean_lines = []
-        for line in lines:
-            if '//' in line:
-                line = line.split('//')[0]  # Keep only part before comment
-            clean_lines.append(line)
-        clean_code = '\n'.join(clean_lines)
+        clean_code = self._COMMENT_RE.sub('', code)
         
         # Check for forbidden tokens (ignoring comments)
-        for forbidden in self.FORBIDDEN_TOKENS:
-            pattern = r'\b' + re.escape(forbidden) + r'\b'
-            if re.search(pattern, clean_code):
-                raise SyntaxError(
-                    f"FORBIDDEN SYNTAX: '{forbidden}' cannot appear in QGL. "
-                    f"QGL is structural, not procedural."
-                )
+        forbidden = self._FORBIDDEN_RE.search(clean_code)
+        if forbidden:
+            raise SyntaxError(
+                f"FORBIDDEN SYNTAX: '{forbidden.group(1)}' cannot appear in QGL. "
+                f"QGL is structural, not procedural."
+            )
         
-        # Tokenize allowed patterns
-        while self.position < len(code):
-            matched = False
+        # Tokenize allowed patterns in one sweep
+        for match in self._TOKEN_RE.finditer(code):
+            if match.start() != self.position:
+                break  # Gap: no pattern matches at self.position
+            
+            token_type = match.lastgroup
             
-            for token_type, pattern in self.TOKEN_PATTERNS:
-                regex = re.compile(pattern)
-                match = regex.match(code, self.position)
+            # Skip whitespace and comments
+            if token_type != 'WHITESPACE' and token_type != 'COMMENT':
+                value = match.group()
+                # Special handling for quantum states
+                if token_type == 'QUANTUM_STATE':
+                    # Normalize quantum state representation
+                    value = self._normalize_quantum_state(value)
                 
-                if match:
-                    matched = True
-                    value = match.group(0)
-                    
-                    # Skip whitespace and comments
-                    if token_type not in ['WHITESPACE', 'COMMENT']:
-                        # Special handling for quantum states
-                        if token_type == 'QUANTUM_STATE':
-                            # Normalize quantum state representation
-                            value = self._normalize_quantum_state(value)
-                        
-                        self.tokens.append((token_type, value))
-                    
-                    self.position = match.end()
-                    break
+                self.tokens.append((token_type, value))
             
-            if not matched:
-                # Invalid character
-                raise SyntaxError(
-                    f"Invalid character at position {self.position}: "
-                    f"'{code[self.position]}'\n"
-                    f"Context: '{code[max(0,self.position-20):min(len(code),self.position+20)]}'"
-                )
+            self.position = match.end()
+        
+        if self.position < len(code):
+            # Invalid character
+            raise SyntaxError(
+                f"Invalid character at position {self.position}: "
+                f"'{code[self.position]}'\n"
+                f"Context: '{code[max(0,self.position-20):min(len(code),self.position+20)]}'"
+            )
         
         return self.tokens
     
     def _normalize_quantum_notation(self, code):
         """Normalize quantum notation for consistent parsing"""
-        # Replace common variations
-        replacements = [
-            (r'\|0\s*\>', '|0⟩'),      # |0> → |0⟩
-            (r'\|1\s*\>', '|1⟩'),      # |1> → |1⟩
-            (r'\|\+\s*\>', '|+⟩'),     # |+> → |+⟩
-            (r'\|\-\s*\>', '|-⟩'),     # |-> → |-⟩
-            (r'\|↑\s*\>', '|↑⟩'),      # |↑> → |↑⟩
-            (r'\|↓\s*\>', '|↓⟩'),      # |↓> → |↓⟩
-            (r'\|ψ\s*\>', '|ψ⟩'),      # |ψ> → |ψ⟩
-            (r'\|φ\s*\>', '|φ⟩'),      # |φ> → |φ⟩
-            (r'\|α\s*\>', '|α⟩'),      # |α> → |α⟩
-            (r'\|β\s*\>', '|β⟩'),      # |β> → |β⟩
-            (r'\|\s*0\s*\⟩', '|0⟩'),   # Clean up spaces
-            (r'\|\s*1\s*\⟩', '|1⟩'),
-            (r'\|\s*\+\s*\⟩', '|+⟩'),
-            (r'\|\s*\-\s*\⟩', '|-⟩'),
-        ]
-        
-        for pattern, replacement in replacements:
-            code = re.sub(pattern, replacement, code)
+        for regex, replacement in self._QUANTUM_REPLACEMENTS:
+            code = regex.sub(replacement, code)
         
         return code
     
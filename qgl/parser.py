@@ -1,11 +1,103 @@
 """
 QGL Parser - Builds structural AST, no time/iteration concepts
 """
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple, Union
+
+# In-place edits to any boundary, domain or qubit. A structure does not
+# know which programs hold it, so programs fold this into their revision
+_structure_edits = 0
+
+class _TrackedList(list):
+    """List that reports every in-place change to the object holding it"""
+    __slots__ = ('_holder', '_field')
+    
+    def __init__(self, items=(), holder=None, field=None):
+        super().__init__(items)
+        self._holder = holder
+        self._field = field
+    
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain lists; holders wrap them again
+        return list, (list(self),)
+    
+    def _changed(self):
+        self._holder._touch(self._field)
+    
+    def append(self, item):
+        super().append(item)
+        self._changed()
+    
+    def extend(self, items):
+        super().extend(items)
+        self._changed()
+    
+    def __iadd__(self, items):
+        super().__iadd__(items)
+        self._changed()
+        return self
+    
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._changed()
+        return self
+    
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed()
+    
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
+    
+    def pop(self, *index):
+        item = super().pop(*index)
+        self._changed()
+        return item
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._changed()
+    
+    def reverse(self):
+        super().reverse()
+        self._changed()
+    
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+    
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+class _Structure:
+    """Base for boundaries, domains and qubits: counts edits after creation"""
+    
+    def __setattr__(self, name, value):
+        if isinstance(value, list):
+            value = _TrackedList(value, self)
+        replacing = name in self.__dict__
+        object.__setattr__(self, name, value)
+        if replacing:
+            self._touch(name)
+    
+    def __setstate__(self, state):
+        for name, value in state.items():
+            if isinstance(value, list):
+                value = _TrackedList(value, self)
+            object.__setattr__(self, name, value)
+    
+    def _touch(self, field):
+        global _structure_edits
+        _structure_edits += 1
 
 @dataclass
-class Boundary:
+class Boundary(_Structure):
     name: str
     content: List[str]  # Names of structures inside
     
@@ -18,7 +110,7 @@ class Boundary:
             )
 
 @dataclass
-class Domain:
+class Domain(_Structure):
     name: str
     states: List[str]  # State names, may include ⊕ for unresolved
     
@@ -26,7 +118,7 @@ class Domain:
         return any('⊕' in state for state in self.states)
 
 @dataclass
-class Qubit:
+class Qubit(_Structure):
     name: str
     state_a: str
     state_b: str
@@ -37,6 +129,63 @@ class QGLProgram:
     boundaries: List[Boundary]
     domains: List[Domain]
     qubits: List[Qubit]
+    # Changes to this program's structure lists (all of them, and domains
+    # alone); with _structure_edits they make up the revisions below
+    _edits: int = field(default=0, init=False, repr=False, compare=False)
+    _domain_edits: int = field(default=0, init=False, repr=False, compare=False)
+    # Revision at which AdmissibilityEngine last found the program admissible
+    _admissible_revision: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (domains revision, all individual domain states); rebuilt by
+    # AdmissibilityEngine when the domains have changed since
+    _domain_states_cache: Optional[Tuple[tuple, Set[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name, value):
+        if name in _PROGRAM_LISTS:
+            replacing = name in self.__dict__
+            object.__setattr__(self, name, _TrackedList(value, self, name))
+            if replacing:
+                self._touch(name)
+        else:
+            object.__setattr__(self, name, value)
+    
+    def __getstate__(self):
+        # Revisions count edits in this process only - drop what relies on them
+        state = self.__dict__.copy()
+        state['_admissible_revision'] = None
+        state['_domain_states_cache'] = None
+        return state
+    
+    def __setstate__(self, state):
+        for name, value in state.items():
+            if name in _PROGRAM_LISTS:
+                value = _TrackedList(value, self, name)
+            object.__setattr__(self, name, value)
+    
+    def _touch(self, field):
+        self._edits += 1
+        if field == 'domains':
+            self._domain_edits += 1
+    
+    @property
+    def _revision(self) -> tuple:
+        """Changes whenever the program or any structure in it is edited"""
+        return (self._edits, _structure_edits)
+    
+    @property
+    def _domains_revision(self) -> tuple:
+        """Changes whenever the domain list is edited (and on structure edits)"""
+        return (self._domain_edits, _structure_edits)
+    
+    @property
+    def _admissible(self) -> bool:
+        """True if the program passed a check and has not changed since"""
+        return self._admissible_revision == self._revision
+
+_PROGRAM_LISTS = frozenset(('boundaries', 'domains', 'qubits'))
 
 class QGLParser:
     """Parses QGL tokens into structural AST"""
@@ -29,6 +29,21 @@ class QGLDaemon:
         self.parser = QGLParser()
         self.admissibility = AdmissibilityEngine()
         self.inversion = InversionEngine(self.admissibility)
+        
+        # Request type -> handler(request)
+        self._handlers = {
+            'check_admissibility': lambda request: self._check_admissibility(
+                request.get('qgl_code', '')
+            ),
+            'perform_inversion': lambda request: self._perform_inversion(
+                request.get('qgl_code', ''),
+                request.get('boundary_name', '')
+            ),
+            'get_accumulation': lambda request: {
+                'type': 'accumulation',
+                'data': self.admissibility.get_accumulation()
+            },
+        }
     
     def start(self):
         """Start the daemon (minimal resource usage)"""
@@ -72,26 +87,13 @@ class QGLDaemon:
         """Process a single request"""
         request_type = request.get('type', 'unknown')
         
-        if request_type == 'check_admissibility':
-            qgl_code = request.get('qgl_code', '')
-            return self._check_admissibility(qgl_code)
-        
-        elif request_type == 'perform_inversion':
-            qgl_code = request.get('qgl_code', '')
-            boundary_name = request.get('boundary_name', '')
-            return self._perform_inversion(qgl_code, boundary_name)
-        
-        elif request_type == 'get_accumulation':
-            return {
-                'type': 'accumulation',
-                'data': self.admissibility.get_accumulation()
-            }
-        
-        else:
+        handler = self._handlers.get(request_type)
+        if handler is None:
             return {
                 'type': 'error',
                 'message': f'Unknown request type: {request_type}'
             }
+        return handler(request)
     
     def _check_admissibility(self, qgl_code):
         """Check if QGL code is admissible"""
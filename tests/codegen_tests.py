@@ -0,0 +1,78 @@
+"""
+Codegen Tests - Generated code agrees with itself on every path
+NO performance tests
+"""
+import importlib.util
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+
+from qgl.lexer import QGLLexer
+from qgl.parser import QGLParser
+from qgl.codegen import QGLCodeGenerator
+
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+class TestGeneratedCoherence(unittest.TestCase):
+    """The compiled coherence kernel matches the NumPy fallback"""
+    
+    QGL_CODE = """
+    boundary System {
+        States, q1
+    }
+    
+    domain States {
+        up, down
+    }
+    
+    qubit q1 = { up ⊕ down }
+    """
+    
+    def setUp(self):
+        program = QGLParser().parse(QGLLexer().tokenize(self.QGL_CODE))
+        source = QGLCodeGenerator().generate_python(program, {})
+        self.module = {'__name__': 'qgl_generated'}
+        exec(compile(source, '<qgl_generated>', 'exec'), self.module)
+    
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_fused_kernel_matches_numpy(self):
+        """Same occupancy exactly, same total information up to rounding"""
+        lattice = self.module['VoidLattice'](1000)
+        for point_id in (0, 5, 16, 999):
+            lattice.place_structure(point_id, 'boundary', name=f'B{point_id}')
+        
+        compiled = lattice.calculate_coherence()
+        self.module['_fused_coherence'] = None  # force the NumPy path
+        fallback = lattice.calculate_coherence()
+        
+        self.assertEqual(compiled['occupancy'], fallback['occupancy'])
+        np.testing.assert_allclose(
+            compiled['total_information'], fallback['total_information'], rtol=1e-12
+        )
+
+class TestGeneratedConstants(unittest.TestCase):
+    """Generated constants never change the simulated lattice"""
+    
+    def _lattice(self, constants):
+        program = QGLParser().parse(QGLLexer().tokenize("boundary System { a }"))
+        results = {'constants_generated': constants}
+        source = QGLCodeGenerator().generate_python(program, results)
+        module = {'__name__': 'qgl_generated'}
+        exec(compile(source, '<qgl_generated>', 'exec'), module)
+        return module['VoidLattice'](100)
+    
+    def test_constants_named_like_lattice_spacing(self):
+        """Constants called phi, angle_step, ... do not shadow the lattice's own"""
+        plain = self._lattice({})
+        shadowed = self._lattice({
+            'phi': 2.0, 'inv_phi': 0.5, 'angle_step': 1.0, 'tension_mod': 3,
+        })
+        
+        np.testing.assert_array_equal(shadowed.info_vectors, plain.info_vectors)
+        np.testing.assert_array_equal(shadowed.tensions, plain.tensions)
+
+if __name__ == '__main__':
+    unittest.main()
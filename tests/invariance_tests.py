@@ -2,6 +2,8 @@
 Invariance Tests - Same result regardless of representation
 NO hardware tests, NO performance tests
 """
+import contextlib
+import io
 import unittest
 import sys
 import os
@@ -9,6 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from qgl.lexer import QGLLexer
 from qgl.parser import QGLParser
+from qgl.interpreter import StructuralInterpreter
 from engine.admissibility import AdmissibilityEngine
 
 class TestTickCountInvariance(unittest.TestCase):
@@ -112,6 +115,97 @@ class TestTickCountInvariance(unittest.TestCase):
                     f"Mismatch: '{code1}' -> {admissible1}, '{code2}' -> {admissible2}"
                 )
 
+class TestSourceEncodingInvariance(unittest.TestCase):
+    """Tokens must not depend on whether source arrives as str or UTF-8 bytes"""
+    
+    QGL_CODE = """
+    boundary System {
+        States, q1
+    }
+    
+    domain States {
+        up, down
+    }
+    
+    qubit q1 = { up ⊕ down }
+    qubit q2 = { |0⟩ ⊕ |1> }
+    """
+    
+    def test_bytes_match_str(self):
+        """UTF-8 bytes (and views of them) tokenize like the decoded str"""
+        lexer = QGLLexer()
+        expected = lexer.tokenize(self.QGL_CODE)
+        self.assertIn(('PLUS', '⊕'), expected)
+        self.assertTrue(any(t == 'QUANTUM_STATE' and '⟩' in v for t, v in expected))
+        
+        encoded = self.QGL_CODE.encode('utf-8')
+        self.assertEqual(lexer.tokenize(encoded), expected)
+        self.assertEqual(lexer.tokenize(memoryview(encoded)), expected)
+    
+    def test_demo_file_bytes_match_str(self):
+        """A demo read as bytes tokenizes like the same file read as text"""
+        demo_path = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), 'demos', 'tsp_collapse.qgl'
+        )
+        with open(demo_path, encoding='utf-8') as f:
+            text = f.read()
+        with open(demo_path, 'rb') as f:
+            data = f.read()
+        
+        lexer = QGLLexer()
+        self.assertEqual(lexer.tokenize(data), lexer.tokenize(text))
+    
+    def test_empty_bytes(self):
+        """Empty bytes input gives no tokens, like an empty str"""
+        lexer = QGLLexer()
+        self.assertEqual(lexer.tokenize(b''), [])
+        self.assertEqual(lexer.tokenize(b''), lexer.tokenize(''))
+
+class TestPlacementInvariance(unittest.TestCase):
+    """Placement must not depend on rounding noise in the lattice magnitudes"""
+    
+    QUBIT_CODE = """
+    boundary System {
+        States, q1, q2, q3
+    }
+    
+    domain States {
+        up, down
+    }
+    
+    qubit q1 = { up ⊕ down }
+    qubit q2 = { up ⊕ down }
+    qubit q3 = { up ⊕ down }
+    """
+    
+    def _place(self, code, lattice_size):
+        program = QGLParser().parse(QGLLexer().tokenize(code))
+        with contextlib.redirect_stdout(io.StringIO()):
+            interpreter = StructuralInterpreter(lattice_size)
+            interpreter.execute_program(program)
+        return interpreter.structure_map
+    
+    def test_demo_placement_pinned(self):
+        """Equal-magnitude candidates are taken in lattice order"""
+        demo_path = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), 'demos', 'russell_reject.qgl'
+        )
+        with open(demo_path, encoding='utf-8') as f:
+            code = f.read()
+        
+        expected = {
+            'NormalSet': [0], 'FirstBoundary': [16], 'SecondBoundary': [32],
+            'Elements': [5], 'ExternalReference': [21],
+        }
+        for lattice_size in (64, 1000):
+            self.assertEqual(self._place(code, lattice_size), expected)
+    
+    def test_qubit_placement_pinned(self):
+        """Qubits go to the least-tense points in lattice order"""
+        expected = {'System': [0], 'States': [5], 'q1': [0], 'q2': [16], 'q3': [32]}
+        for lattice_size in (64, 1000):
+            self.assertEqual(self._place(self.QUBIT_CODE, lattice_size), expected)
+    
 class TestHardwareIndependence(unittest.TestCase):
     """
     QGL must give same results on all hardware
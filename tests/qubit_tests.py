@@ -0,0 +1,78 @@
+"""
+Qubit Tests - Entanglement groups in the qubit registry
+NO probabilistic tests, NO measurement tests
+"""
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.qubits import StructuralQubit, QubitRegistry
+
+class TestEntanglementGroups(unittest.TestCase):
+    """Test entanglement group tracking"""
+    
+    def setUp(self):
+        self.registry = QubitRegistry()
+        for name in ('a', 'b', 'c', 'd', 'e'):
+            self.registry.register_qubit(StructuralQubit(name, f'{name}0', f'{name}1'))
+    
+    def test_transitive_merge(self):
+        """a–b, c–d, then b–c gives one group of four"""
+        self.registry.create_entanglement('a', 'b')
+        self.registry.create_entanglement('c', 'd')
+        self.assertCountEqual(
+            self.registry.entanglement_groups, [{'a', 'b'}, {'c', 'd'}]
+        )
+        
+        self.registry.create_entanglement('b', 'c')
+        
+        self.assertEqual(self.registry.entanglement_groups, [{'a', 'b', 'c', 'd'}])
+        for name in ('a', 'b', 'c', 'd'):
+            self.assertEqual(
+                self.registry.get_entanglement_group(name), {'a', 'b', 'c', 'd'}
+            )
+    
+    def test_unentangled_qubit_group(self):
+        """An unentangled qubit is alone in its group"""
+        self.registry.create_entanglement('a', 'b')
+        
+        self.assertEqual(self.registry.get_entanglement_group('e'), {'e'})
+        self.assertEqual(self.registry.get_entanglement_group('unregistered'), {'unregistered'})
+        self.assertNotIn({'e'}, self.registry.entanglement_groups)
+    
+    def test_groups_refresh_after_union(self):
+        """Groups read before a later union reflect that union afterwards"""
+        self.registry.create_entanglement('a', 'b')
+        before = self.registry.get_entanglement_group('a')
+        self.assertEqual(before, {'a', 'b'})
+        self.assertEqual(self.registry.get_entanglement_group('e'), {'e'})
+        
+        self.registry.create_entanglement('b', 'e')
+        
+        self.assertEqual(self.registry.get_entanglement_group('a'), {'a', 'b', 'e'})
+        self.assertEqual(self.registry.get_entanglement_group('e'), {'a', 'b', 'e'})
+        self.assertEqual(self.registry.entanglement_groups, [{'a', 'b', 'e'}])
+        self.assertEqual(before, {'a', 'b'})  # returned groups are copies
+    
+    def test_groups_are_read_only(self):
+        """Mutating a returned group does not change the registry"""
+        self.registry.create_entanglement('a', 'b')
+        
+        self.registry.get_entanglement_group('a').add('z')
+        self.registry.entanglement_groups[0].add('z')
+        
+        self.assertEqual(self.registry.get_entanglement_group('a'), {'a', 'b'})
+        with self.assertRaises(AttributeError):
+            self.registry.entanglement_groups = []
+    
+    def test_pairwise_links_recorded(self):
+        """Entanglement is recorded on both qubits"""
+        self.registry.create_entanglement('a', 'b')
+        
+        self.assertEqual(self.registry.qubits['a'].entangled_with, {'b'})
+        self.assertEqual(self.registry.qubits['b'].entangled_with, {'a'})
+        self.assertFalse(self.registry.qubits['c'].is_entangled())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,7 +8,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from qgl.lexer import QGLLexer
-from qgl.parser import QGLParser
+from qgl.parser import QGLParser, QGLProgram, Boundary, Domain
 from engine.admissibility import AdmissibilityEngine
 
 class TestStructuralAdmissibility(unittest.TestCase):
@@ -146,6 +146,38 @@ class TestStructuralAdmissibility(unittest.TestCase):
         self.assertFalse(admissible)
         self.assertIn("not in any domain", reason)
     
+    def test_qubit_domain_recheck_after_domain_change(self):
+        """Re-checking after domains change uses the new domain states"""
+        qgl_code = """
+        boundary System {
+            Elements, q1
+        }
+        
+        domain Elements {
+            apple, banana
+        }
+        
+        qubit q1 = { apple ⊕ banana }
+        """
+        
+        tokens = self.lexer.tokenize(qgl_code)
+        program = self.parser.parse(tokens)
+        self.assertTrue(self.engine.check_structure(program)[0])
+        
+        # Replace the domain
+        program.domains[0] = Domain('Elements', ['apple'])
+        admissible, reason = self.engine.check_structure(program)
+        self.assertFalse(admissible)
+        self.assertIn("Qubit state 'banana' not in any domain", reason)
+        
+        # Edit the domain in place
+        program.domains[0].states.append('banana')
+        self.assertTrue(self.engine.check_structure(program)[0])
+        program.domains[0].states.remove('apple')
+        admissible, reason = self.engine.check_structure(program)
+        self.assertFalse(admissible)
+        self.assertIn("Qubit state 'apple' not in any domain", reason)
+    
     def test_inversion_preserves_admissibility(self):
         """Inversion should transform admissible → admissible"""
         from engine.inversion import InversionEngine
@@ -179,6 +211,179 @@ class TestStructuralAdmissibility(unittest.TestCase):
         # Check new structure is admissible
         admissible_after, reason_after = self.engine.check_structure(new_program)
         self.assertTrue(admissible_after, f"After inversion: {reason_after}")
+    
+    def test_inversion_rejects_uncontained_domain(self):
+        """Inversion that leaves a domain outside every boundary is rolled back"""
+        from engine.inversion import InversionEngine
+        
+        qgl_code = """
+        boundary Outer {
+            Elements
+        }
+        
+        domain Elements {
+            apple, banana
+        }
+        """
+        
+        tokens = self.lexer.tokenize(qgl_code)
+        program = self.parser.parse(tokens)
+        
+        inversion_engine = InversionEngine(self.engine)
+        new_program, success, inv_reason = inversion_engine.invert(program, "Outer")
+        
+        self.assertFalse(success)
+        self.assertIn("Domain 'Elements' not contained in any boundary", inv_reason)
+        self.assertIs(new_program, program)
+    
+    def test_inversion_rejects_program_that_failed_recheck(self):
+        """A failed re-check clears the admissible flag, so inversion re-checks"""
+        from engine.inversion import InversionEngine
+        
+        qgl_code = """
+        boundary Outer {
+            Inner, element
+        }
+        
+        boundary Inner {
+            sub_element
+        }
+        """
+        
+        tokens = self.lexer.tokenize(qgl_code)
+        program = self.parser.parse(tokens)
+        self.assertTrue(self.engine.check_structure(program)[0])
+        
+        # Make the program circular after it passed
+        program.boundaries.append(Boundary('A', ['B']))
+        program.boundaries.append(Boundary('B', ['A']))
+        admissible, reason = self.engine.check_structure(program)
+        self.assertFalse(admissible)
+        self.assertFalse(program._admissible)
+        
+        inversion_engine = InversionEngine(self.engine)
+        new_program, success, inv_reason = inversion_engine.invert(program, "Outer")
+        
+        self.assertFalse(success)
+        self.assertIn("Circular containment detected", inv_reason)
+        self.assertIs(new_program, program)
+    
+    def test_inversion_rejects_program_made_circular_in_place(self):
+        """Edits after a passing check clear the admissible flag"""
+        from engine.inversion import InversionEngine
+        
+        program = QGLProgram([Boundary('A', ['X'])], [], [])
+        self.assertTrue(self.engine.check_structure(program)[0])
+        self.assertTrue(program._admissible)
+        
+        # Make the program circular without re-checking it
+        program.boundaries.append(Boundary('B', ['C']))
+        program.boundaries.append(Boundary('C', ['B']))
+        self.assertFalse(program._admissible)
+        
+        inversion_engine = InversionEngine(self.engine)
+        new_program, success, inv_reason = inversion_engine.invert(program, "A")
+        
+        self.assertFalse(success)
+        self.assertIn("Cannot invert inadmissible structure", inv_reason)
+        self.assertIn("Circular containment detected", inv_reason)
+        self.assertIs(new_program, program)
+        
+        # Editing a boundary's content in place is seen as well
+        program = QGLProgram([Boundary('A', ['X']), Boundary('B', ['Y'])], [], [])
+        self.assertTrue(self.engine.check_structure(program)[0])
+        program.boundaries[0].content.append('B')
+        program.boundaries[1].content.append('A')
+        
+        new_program, success, inv_reason = inversion_engine.invert(program, "A")
+        
+        self.assertFalse(success)
+        self.assertIn("Circular containment detected", inv_reason)
+    
+    def test_inversion_after_boundaries_change(self):
+        """Boundaries added after a check are seen by the next inversion"""
+        from engine.inversion import InversionEngine
+        
+        qgl_code = """
+        boundary Outer {
+            Elements
+        }
+        """
+        
+        tokens = self.lexer.tokenize(qgl_code)
+        program = self.parser.parse(tokens)
+        self.assertTrue(self.engine.check_structure(program)[0])
+        
+        # Redeclare Outer after the containment index was built
+        program.boundaries.append(Boundary('Outer', ['Zed']))
+        
+        inversion_engine = InversionEngine(self.engine)
+        new_program, success, inv_reason = inversion_engine.invert(program, "Outer")
+        
+        self.assertTrue(success, inv_reason)
+        self.assertEqual([b.name for b in new_program.boundaries], ['Elements'])
+        admissible_after, reason_after = AdmissibilityEngine().check_structure(new_program)
+        self.assertTrue(admissible_after, reason_after)
+
+class TestIncrementalCheck(unittest.TestCase):
+    """check_incremental re-validates only the changed names"""
+    
+    def setUp(self):
+        self.engine = AdmissibilityEngine()
+        qgl_code = """
+        boundary Outer {
+            Inner, Elements
+        }
+        
+        boundary Inner {
+            element
+        }
+        
+        domain Elements {
+            apple, banana
+        }
+        """
+        tokens = QGLLexer().tokenize(qgl_code)
+        self.program = QGLParser().parse(tokens)
+        self.assertTrue(self.engine.check_structure(self.program)[0])
+    
+    def test_unchanged_program_admissible(self):
+        """An admissible program stays admissible"""
+        admissible, reason = self.engine.check_incremental(self.program, {'Inner'})
+        
+        self.assertTrue(admissible, reason)
+        self.assertTrue(self.program._admissible)
+    
+    def test_self_containment_rejection(self):
+        """A changed boundary that now contains itself is rejected"""
+        self.program.boundaries[1].content.append('Inner')
+        
+        admissible, reason = self.engine.check_incremental(self.program, {'Inner'})
+        
+        self.assertFalse(admissible)
+        self.assertEqual(reason, "Boundary 'Inner' contains itself")
+        self.assertFalse(self.program._admissible)
+    
+    def test_circular_containment_rejection(self):
+        """A changed boundary that closes a cycle is rejected"""
+        self.program.boundaries[1].content.append('Outer')
+        
+        admissible, reason = self.engine.check_incremental(self.program, {'Inner'})
+        
+        self.assertFalse(admissible)
+        self.assertEqual(reason, "Circular containment detected")
+        self.assertFalse(self.program._admissible)
+    
+    def test_uncontained_domain_rejection(self):
+        """A changed domain left outside every boundary is rejected"""
+        self.program.boundaries[0].content.remove('Elements')
+        
+        admissible, reason = self.engine.check_incremental(
+            self.program, {'Outer', 'Elements'}
+        )
+        
+        self.assertFalse(admissible)
+        self.assertEqual(reason, "Domain 'Elements' not contained in any boundary")
 
 class TestInvariance(unittest.TestCase):
     """Test invariance under different representations"""